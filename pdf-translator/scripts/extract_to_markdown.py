@@ -5,8 +5,12 @@ import argparse
 import json
 import os
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
 try:
     import fitz
@@ -15,14 +19,21 @@ except ImportError:
     exit(1)
 
 try:
-    import pdfplumber
+    import wordninja
 except ImportError:
-    pdfplumber = None
+    wordninja = None
+
+_HAS_WORDNINJA = wordninja is not None
 
 try:
-    import wordninja
+    import ahocorasick
 except ImportError:
-    wordninja = None
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Common English words for reverse text detection
 COMMON_WORDS = {
@@ -46,6 +57,10 @@ COMMON_WORDS = {
 }
 
 
+# Affixes used to judge whether a word reads as English forwards or backwards
+COMMON_PREFIXES = ('pre', 'pro', 'con', 'dis', 'mis', 'un', 're', 'in', 'ex', 'de', 'en', 'em')
+COMMON_SUFFIXES = ('tion', 'ing', 'ness', 'ment', 'able', 'ible', 'ous', 'ive', 'ful', 'less', 'ly', 'er', 'ed')
+
 
 @dataclass
 class DocumentMetadata:
@@ -54,14 +69,31 @@ class DocumentMetadata:
     page_count: int = 0
     source_file: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "author": self.author,
+            "page_count": self.page_count,
+            "source_file": self.source_file,
+        }
+
+
+_BULLET_CLOSE_PAREN_RE = re.compile(r'●(\w+)\)')
+_OPEN_PAREN_BULLET_RE = re.compile(r'\((\w+)●')
+_BULLET_WRAPPED_RE = re.compile(r'●(\w+)●')
+_SPACED_EMAIL_RE = re.compile(r'([\w.]+)\s+([\w-]+\.(?:com|org|edu|ac|co|net|gov)(?:\.[a-z]{2,})?)\b')
+
 
 def fix_corrupted_chars(text: str) -> str:
     """Fix common character corruption from PDF extraction."""
-    text = re.sub(r'●(\w+)\)', r'(\1)', text)
-    text = re.sub(r'\((\w+)●', r'(\1)', text)
-    text = re.sub(r'●(\w+)●', r'(\1)', text)
-    text = re.sub(r'●', '', text)
-    text = re.sub(r'([\w.]+)\s+([\w-]+\.(?:com|org|edu|ac|co|net|gov)(?:\.[a-z]{2,})?)\b', r'\1@\2', text)
+    # Cheap substring checks skip the regex passes on clean text
+    if '●' in text:
+        text = _BULLET_CLOSE_PAREN_RE.sub(r'(\1)', text)
+        text = _OPEN_PAREN_BULLET_RE.sub(r'(\1)', text)
+        text = _BULLET_WRAPPED_RE.sub(r'(\1)', text)
+        text = text.replace('●', '')
+    if '.' in text:
+        text = _SPACED_EMAIL_RE.sub(r'\1@\2', text)
     return text
 
 
@@ -78,37 +110,26 @@ def is_reversed_text(text: str) -> bool:
     if not text.isalpha():
         return False
 
-    text_lower = text.lower()
-    reversed_lower = text_lower[::-1]
+    text_lower = text if text.islower() else text.lower()
 
     # If the original word is already a known English word, it's NOT reversed
     if text_lower in COMMON_WORDS:
         return False
 
     # Check if reversed version is a known word (and original is not)
+    reversed_lower = text_lower[::-1]
     if reversed_lower in COMMON_WORDS:
         return True
 
     # Check if reversed starts with common prefixes (only if original doesn't look English)
     # Be very conservative - only apply if original has NO common prefix
-    common_prefixes = ['pre', 'pro', 'con', 'dis', 'mis', 'un', 're', 'in', 'ex', 'de', 'en', 'em']
-    common_suffixes = ['tion', 'ing', 'ness', 'ment', 'able', 'ible', 'ous', 'ive', 'ful', 'less', 'ly', 'er', 'ed']
 
     # If original has common English patterns, don't treat as reversed
-    for suffix in common_suffixes:
-        if text_lower.endswith(suffix):
-            return False
-
-    for prefix in common_prefixes:
-        if text_lower.startswith(prefix):
-            return False
+    if text_lower.endswith(COMMON_SUFFIXES) or text_lower.startswith(COMMON_PREFIXES):
+        return False
 
     # Now check if reversed looks more like English
-    for prefix in common_prefixes:
-        if reversed_lower.startswith(prefix):
-            return True
-
-    return False
+    return reversed_lower.startswith(COMMON_PREFIXES)
 
 
 def fix_reversed_text(text: str) -> str:
@@ -129,13 +150,57 @@ def fix_reversed_text(text: str) -> str:
     return ' '.join(fixed_words)
 
 
+# Deletes every non-letter ASCII character, leaving only the letters to count
+_NON_ALPHA_DELETE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if not c.isalpha()))
+
+
+def count_alpha(text: str) -> int:
+    """Count alphabetic characters, using str.translate for ASCII text."""
+    if text.isascii():
+        return len(text.translate(_NON_ALPHA_DELETE))
+    return sum(1 for c in text if c.isalpha())
+
+
+@lru_cache(maxsize=65536)
+def wordninja_split(word: str) -> Tuple[str, ...]:
+    """Cached wordninja.split; the same long terms recur across pages and tables."""
+    return tuple(wordninja.split(word))
+
+
+# Valid 1-2 letter English words (not suffix artifacts)
+VALID_1CHAR_WORDS = frozenset({'a', 'i'})
+VALID_2CHAR_WORDS = frozenset({'is', 'as', 'no', 'to', 'be', 'we', 'he', 'me', 'it', 'in', 'on',
+                               'or', 'an', 'at', 'by', 'do', 'go', 'if', 'of', 'so', 'up', 'my'})
+# Suffix artifacts that indicate bad splits
+SUFFIX_ARTIFACTS = frozenset({'al', 'ed', 'er', 'ly', 'es', 'en', 'le', 'el', 'ic', 'ty'})
+
+
+def is_valid_wordninja_split(words) -> bool:
+    """Check a wordninja split in one pass.
+
+    Each word must be 3+ chars or a valid 1-2 char English word
+    (case-insensitive, so "A" and "I" are allowed), and no word may be a
+    suffix artifact.
+    """
+    for w in words:
+        if len(w) >= 3:
+            continue
+        lower = w.lower()
+        if len(w) == 2:
+            if lower in SUFFIX_ARTIFACTS or lower not in VALID_2CHAR_WORDS:
+                return False
+        elif len(w) != 1 or lower not in VALID_1CHAR_WORDS:
+            return False
+    return True
+
+
 def split_concatenated_text(text: str) -> str:
     """Split concatenated text using wordninja library.
 
     This handles cases where words are joined without spaces.
     Uses quality heuristics to avoid bad splits.
     """
-    if wordninja is None:
+    if not _HAS_WORDNINJA:
         return text
 
     if not text or ' ' in text:
@@ -158,12 +223,12 @@ def split_concatenated_text(text: str) -> str:
             return text
 
     # Skip if mostly non-alphabetic
-    alpha_count = sum(1 for c in text if c.isalpha())
+    alpha_count = count_alpha(text)
     if alpha_count / len(text) < 0.7:
         return text
 
     # Use wordninja to split
-    words = wordninja.split(text)
+    words = wordninja_split(text)
 
     if len(words) > 1:
         # Quality check: evaluate if the split is good
@@ -189,8 +254,8 @@ def split_concatenated_text(text: str) -> str:
 def merge_broken_words(text: str) -> str:
     """Merge words that were incorrectly split by PDF extraction.
 
-    PDF extraction with x_tolerance sometimes splits proper nouns or
-    technical terms into multiple short fragments.
+    PDF text extraction sometimes splits proper nouns or technical terms
+    into multiple short fragments.
     e.g., "Glia no rex" -> "Glianorex"
     """
     if not text or ' ' not in text:
@@ -242,6 +307,26 @@ def merge_broken_words(text: str) -> str:
     return ' '.join(result)
 
 
+@lru_cache(maxsize=10000)
+def very_short_alpha_ratio(text: str) -> Tuple[Tuple[str, ...], float]:
+    """Split text into words and return (words, share of alphabetic words with 1-2 chars).
+
+    Broken extraction like "A ve ra ge con fi den ce" has a ratio near 1.0.
+    Cached so that process_table_cell and fix_broken_spaces share the work
+    for the same cell text.
+    """
+    words = tuple(text.split())
+    alpha_words = [w for w in words if w.isalpha()]
+    if not alpha_words:
+        return words, 0.0
+    very_short_count = sum(1 for w in alpha_words if len(w) <= 2)
+    return words, very_short_count / len(alpha_words)
+
+
+_SPLIT_CAPITAL_RE = re.compile(r'\b([B-HJ-Z])\s+([a-z]{2,})')
+_SPLIT_TRAILING_LETTER_RE = re.compile(r'([a-z]{3,})\s+([a-z])\b')
+
+
 def fix_broken_spaces(text: str) -> str:
     """Fix text with incorrectly inserted spaces from PDF extraction.
 
@@ -261,17 +346,11 @@ def fix_broken_spaces(text: str) -> str:
     # Pattern 1: Detect if text has EXTREMELY many short word fragments
     # This indicates broken text like "A ve ra ge con fi den ce"
     # Normal English has short words but NOT 80%+ being 1-2 chars
-    words = result.split()
-    if len(words) > 3:
-        alpha_words = [w for w in words if w.isalpha()]
-        if alpha_words:
-            # Count very short words (1-2 chars only)
-            very_short_count = sum(1 for w in alpha_words if len(w) <= 2)
-            very_short_ratio = very_short_count / len(alpha_words)
-            if very_short_ratio >= 0.8:
-                # Almost all words are 1-2 chars - clearly broken text
-                result = result.replace(' ', '')
-                return result
+    words, very_short_ratio = very_short_alpha_ratio(result)
+    if len(words) > 3 and very_short_ratio >= 0.8:
+        # Almost all words are 1-2 chars - clearly broken text
+        result = result.replace(' ', '')
+        return result
 
     # Pattern 2: Fix only clearly broken patterns (NOT normal text)
     # Be very conservative to avoid breaking valid sentences
@@ -281,20 +360,31 @@ def fix_broken_spaces(text: str) -> str:
     # "M edical" -> "Medical" (single uppercase followed by space and lowercase)
     # but NOT "A physician" (valid article)
     # Only apply if the uppercase letter is NOT a common article/word
-    result = re.sub(r'\b([B-HJ-Z])\s+([a-z]{2,})', r'\1\2', result)
+    result = _SPLIT_CAPITAL_RE.sub(r'\1\2', result)
 
     # "accurac y" -> "accuracy" (letter before single trailing letter)
     # Only if the trailing letter makes sense as part of the word
-    result = re.sub(r'([a-z]{3,})\s+([a-z])\b', r'\1\2', result)
+    result = _SPLIT_TRAILING_LETTER_RE.sub(r'\1\2', result)
 
     return result
 
 
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+_DIGIT_WORD_RE = re.compile(r'(\d)([a-z]{3,})')
+_PERIOD_CAPITAL_RE = re.compile(r'\.([A-Z])')
+_QUESTION_CAPITAL_RE = re.compile(r'\?([A-Z])')
+_PAREN_LETTER_RE = re.compile(r'\)([A-Za-z])')
+_BRACKET_LETTER_RE = re.compile(r'\]([A-Za-z])')
+_LETTER_PAREN_RE = re.compile(r'([a-z])\(')
+
+
+@lru_cache(maxsize=16384)
 def add_spaces_to_concatenated_text(text: str) -> str:
     """Add spaces to text where words are concatenated without spaces.
 
     This handles PDF extraction issues where words are joined together.
-    Uses conservative heuristics to avoid breaking valid words.
+    Uses conservative heuristics to avoid breaking valid words. Cached, since
+    the same long identifiers recur across pages.
     """
     if not text or len(text) < 3:
         return text
@@ -303,40 +393,96 @@ def add_spaces_to_concatenated_text(text: str) -> str:
 
     # 1. Add space before capital letters following lowercase (camelCase)
     # e.g., "AverageConfidence" -> "Average Confidence"
-    result = re.sub(r'([a-z])([A-Z])', r'\1 \2', result)
+    result = _CAMEL_CASE_RE.sub(r'\1 \2', result)
 
     # 2. Add space between number and letter transitions (conservative)
     # Only for clear cases like "7patients" -> "7 patients"
     # Skip patterns that look like model names (GPT-4o) or versions
-    result = re.sub(r'(\d)([a-z]{3,})', r'\1 \2', result)  # digit followed by 3+ lowercase
+    result = _DIGIT_WORD_RE.sub(r'\1 \2', result)  # digit followed by 3+ lowercase
 
     # 3. Add space after common sentence-ending patterns
-    result = re.sub(r'\.([A-Z])', r'. \1', result)
-    result = re.sub(r'\?([A-Z])', r'? \1', result)
+    result = _PERIOD_CAPITAL_RE.sub(r'. \1', result)
+    result = _QUESTION_CAPITAL_RE.sub(r'? \1', result)
 
     # 4. Add space after closing parentheses/brackets followed by letters
-    result = re.sub(r'\)([A-Za-z])', r') \1', result)
-    result = re.sub(r'\]([A-Za-z])', r'] \1', result)
+    result = _PAREN_LETTER_RE.sub(r') \1', result)
+    result = _BRACKET_LETTER_RE.sub(r'] \1', result)
 
     # 5. Add space before opening parentheses preceded by letters
-    result = re.sub(r'([a-z])\(', r'\1 (', result)
+    result = _LETTER_PAREN_RE.sub(r'\1 (', result)
 
     # 6. Handle specific known concatenation patterns (conservative)
-    # Only use words that are 4+ characters to avoid false positives
-    boundary_words = [
-        'confidence', 'accuracy', 'recall', 'precision',
-        'average', 'medium', 'high', 'low',
-        'patient', 'presents', 'history', 'symptoms',
-        'treatment', 'diagnosis', 'question', 'answer'
-    ]
-    for word in boundary_words:
-        # Add space before word if preceded by lowercase letter
-        pattern = rf'([a-z])({word})'
-        result = re.sub(pattern, rf'\1 \2', result, flags=re.IGNORECASE)
+    result = insert_boundary_spaces(result)
 
     return result
 
 
+# Known words that commonly appear glued to a preceding word in PDF text
+BOUNDARY_WORDS = [
+    'confidence', 'accuracy', 'recall', 'precision',
+    'average', 'medium', 'high', 'low',
+    'patient', 'presents', 'history', 'symptoms',
+    'treatment', 'diagnosis', 'question', 'answer'
+]
+
+_BOUNDARY_PATTERNS = [re.compile(rf'([a-z])({word})', re.IGNORECASE) for word in BOUNDARY_WORDS]
+
+if ahocorasick is not None:
+    _BOUNDARY_AUTOMATON = ahocorasick.Automaton()
+    for _priority, _word in enumerate(BOUNDARY_WORDS):
+        _BOUNDARY_AUTOMATON.add_word(_word, (_priority, len(_word)))
+    _BOUNDARY_AUTOMATON.make_automaton()
+else:
+    _BOUNDARY_AUTOMATON = None
+
+
+def insert_boundary_spaces(text: str) -> str:
+    """Add a space before each BOUNDARY_WORDS occurrence preceded by a letter.
+
+    Uses a single Aho-Corasick scan when pyahocorasick is available, and
+    falls back to one regex pass per word otherwise. Both paths give the
+    same result as applying the per-word substitutions in list order.
+    """
+    # Case-folding can change string length outside ASCII, so only scan
+    # ASCII text with the automaton
+    if _BOUNDARY_AUTOMATON is None or not text.isascii():
+        for pattern in _BOUNDARY_PATTERNS:
+            text = pattern.sub(r'\1 \2', text)
+        return text
+
+    matches = sorted(
+        (priority, end - length + 1, end + 1)
+        for end, (priority, length) in _BOUNDARY_AUTOMATON.iter(text.lower())
+    )
+    if not matches:
+        return text
+
+    # Replay the per-word substitutions: a match needs a letter before it
+    # that no earlier match of the same word consumed, and must not have
+    # been split by a space inserted for an earlier word
+    insert_at = set()
+    last_priority = -1
+    last_end = 0
+    for priority, start, end in matches:
+        if priority != last_priority:
+            last_priority = priority
+            last_end = 0
+        if start == 0 or start - 1 < last_end or not text[start - 1].isalpha():
+            continue
+        if any(i in insert_at for i in range(start, end)):
+            continue
+        insert_at.add(start)
+        last_end = end
+
+    parts = []
+    prev = 0
+    for i in sorted(insert_at):
+        parts.append(text[prev:i])
+        prev = i
+    parts.append(text[prev:])
+    return ' '.join(parts)
+
+
 def is_valid_table_cell(text: str) -> bool:
     """Check if cell content looks like valid table data."""
     if not text or not text.strip():
@@ -439,9 +585,11 @@ HEADER_FOOTER_PATTERNS = [
     r'^\d{4}\s*(©|Copyright)',
 ]
 
-HEADER_FOOTER_COMPILED = [re.compile(p, re.IGNORECASE) for p in HEADER_FOOTER_PATTERNS]
+# Single alternation so each block needs one match call instead of one per pattern
+_HEADER_FOOTER_UNION = re.compile('|'.join(f'(?:{p})' for p in HEADER_FOOTER_PATTERNS), re.IGNORECASE)
 
 
+@lru_cache(maxsize=4096)
 def is_header_footer(text: str) -> bool:
     """Check if text is a page header or footer using generic patterns."""
     text = text.strip()
@@ -450,36 +598,52 @@ def is_header_footer(text: str) -> bool:
     if len(text) < 3:
         return True
 
-    for pattern in HEADER_FOOTER_COMPILED:
-        if pattern.match(text):
-            return True
+    return _HEADER_FOOTER_UNION.match(text) is not None
 
-    return False
+
+_AFFILIATION_COMMA_RE = re.compile(r'(\w+)\n(\d+(?:,\d+)*)\n,\s*')
+_AFFILIATION_END_RE = re.compile(r'(\w+)\n(\d+(?:,\d+)*)\s*$')
+_AFFILIATION_SPACE_RE = re.compile(r'(\w+)\n(\d+(?:,\d+)*)\s+')
+_INLINE_REF_RE = re.compile(r'(\w+)(\d{1,2})([,.\s])')
+_INLINE_REF_RANGE_RE = re.compile(r'(\w+)(\d{1,2}–\d{1,2})([,.\s])')
 
 
 def merge_superscripts(text: str) -> str:
     """Merge superscript numbers (like author affiliations and references) with preceding text."""
     # Fix author affiliations: "Name\n1,2" -> "Name^1,2"
-    text = re.sub(r'(\w+)\n(\d+(?:,\d+)*)\n,\s*', r'\1^[\2], ', text)
-    text = re.sub(r'(\w+)\n(\d+(?:,\d+)*)\s*$', r'\1^[\2]', text)
-    text = re.sub(r'(\w+)\n(\d+(?:,\d+)*)\s+', r'\1^[\2] ', text)
+    text = _AFFILIATION_COMMA_RE.sub(r'\1^[\2], ', text)
+    text = _AFFILIATION_END_RE.sub(r'\1^[\2]', text)
+    text = _AFFILIATION_SPACE_RE.sub(r'\1^[\2] ', text)
 
     # Fix inline reference numbers: "word1" -> "word^[1]"
-    text = re.sub(r'(\w+)(\d{1,2})([,.\s])', r'\1^[\2]\3', text)
-    text = re.sub(r'(\w+)(\d{1,2}–\d{1,2})([,.\s])', r'\1^[\2]\3', text)
+    text = _INLINE_REF_RE.sub(r'\1^[\2]\3', text)
+    text = _INLINE_REF_RANGE_RE.sub(r'\1^[\2]\3', text)
 
     return text
 
 
+_URL_DOT_SPACE_RE = re.compile(r'(https?://\w+)\.\s+(\w+)')
+_URL_SLASH_SPACE_RE = re.compile(r'(https?://[\w.]+)\s*/\s*')
+_URL_TRAILING_SPACE_RE = re.compile(r'(https?://[\w./]+)\s+(\w+)')
+_DOI_SPACE_RE = re.compile(r'https?://doi\.\s*org')
+
+
 def fix_broken_urls(text: str) -> str:
     """Fix URLs broken during PDF extraction."""
-    result = re.sub(r'(https?://\w+)\.\s+(\w+)', r'\1.\2', text)
-    result = re.sub(r'(https?://[\w.]+)\s*/\s*', r'\1/', result)
-    result = re.sub(r'(https?://[\w./]+)\s+(\w+)', r'\1\2', result)
-    result = re.sub(r'https?://doi\.\s*org', 'https://doi.org', result)
+    if 'http' not in text:
+        return text
+    result = _URL_DOT_SPACE_RE.sub(r'\1.\2', text)
+    result = _URL_SLASH_SPACE_RE.sub(r'\1/', result)
+    result = _URL_TRAILING_SPACE_RE.sub(r'\1\2', result)
+    result = _DOI_SPACE_RE.sub('https://doi.org', result)
     return result
 
 
+_LONG_NUMBER_SEQ_RE = re.compile(r'^[a-z]?\d{5,}(\s+[a-z]?\d{5,})*$')
+_NUMBER_PUNCT_RE = re.compile(r'^[\d\s():,;]+$')
+
+
+@lru_cache(maxsize=4096)
 def filter_artifact_text(text: str) -> bool:
     """Return True if text is artifact/noise."""
     stripped = text.strip()
@@ -489,11 +653,11 @@ def filter_artifact_text(text: str) -> bool:
         return True
 
     # Number sequences (often PDF artifacts)
-    if re.match(r'^[a-z]?\d{5,}(\s+[a-z]?\d{5,})*$', stripped):
+    if _LONG_NUMBER_SEQ_RE.match(stripped):
         return True
 
     # PDF artifact patterns like "1234567890():,;"
-    if re.match(r'^[\d\s():,;]+$', stripped) and len(stripped) > 5:
+    if _NUMBER_PUNCT_RE.match(stripped) and len(stripped) > 5:
         return True
 
     # Header/footer check
@@ -503,23 +667,52 @@ def filter_artifact_text(text: str) -> bool:
     return False
 
 
+_HSPACE_RE = re.compile(r'[ \t]+')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+
 def clean_text(text: str) -> str:
     """Clean extracted text."""
     if not text:
         return ''
     text = fix_corrupted_chars(text)
     text = fix_broken_urls(text)
-    text = re.sub(r'[ \t]+', ' ', text)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '  ' in text or '\t' in text:
+        text = _HSPACE_RE.sub(' ', text)
+    if '\n\n\n' in text:
+        text = _MULTI_NEWLINE_RE.sub('\n\n', text)
     return text.strip()
 
 
+_FIGURE_NUMBER_RE = re.compile(r'^[\d.,]+%?$')
+_FIGURE_SHORT_LABEL_RE = re.compile(r'^[\w\-\.]+\s*\d*[A-Za-z]?$')
+
+# Text patterns that mark a block as a chart element on their own
+CHART_ELEMENT_PATTERNS = [
+    # Model names (common in ML papers)
+    # e.g., "GPT-4o", "Llama 3 70B", "Yi 1.5 9B", "Qwen2 72B"
+    r'(?i:^(GPT|Llama|Yi|Qwen|Mistral|Mixtral|Meerkat|Internist|Claude|Gemini|PaLM)[\s\-]?[\d\.]+[a-zA-Z]*(\s+\d+[BbMmKk])?$)',
+    # Standalone numbers (axis ticks), e.g., "20", "60"
+    r'^\d{1,3}$',
+    # Short text (< 30 chars) with parentheses containing %, often an axis label
+    # e.g., "Accuracy (%)", "Missing answer recall (%)"
+    r'^(?=[\s\S]{0,29}$)[\w\s]+\s*\(%\)$',
+    # Sequence of reference numbers that look like axis ticks
+    # e.g., "^[30] ^[40] ^[50] ^[60] ^[70] ^[80]"
+    r'^(\^?\[\d+\]\s*)+$',
+    # Just reference numbers separated by spaces
+    r'^(\d{1,3}\s+)+\d{1,3}$',
+]
+
+_CHART_ELEMENT_UNION = re.compile('|'.join(f'(?:{p})' for p in CHART_ELEMENT_PATTERNS))
+
+
 def is_figure_label(text: str, font_size: float, avg_size: float, block_bbox: list) -> bool:
     """Detect if text is likely a figure/chart label using generic heuristics."""
     text = text.strip()
 
     # Pure numbers or percentages (axis labels)
-    if re.match(r'^[\d.,]+%?$', text):
+    if _FIGURE_NUMBER_RE.match(text):
         return True
 
     # Very short text with small font (likely axis/legend labels)
@@ -531,7 +724,7 @@ def is_figure_label(text: str, font_size: float, avg_size: float, block_bbox: li
     # - Single words followed by numbers (e.g., "Model 1", "Group A")
     # - Percentage labels
     # - Axis unit labels
-    if re.match(r'^[\w\-\.]+\s*\d*[A-Za-z]?$', text) and len(text) < 20:
+    if _FIGURE_SHORT_LABEL_RE.match(text) and len(text) < 20:
         if font_size < avg_size:
             return True
 
@@ -539,13 +732,17 @@ def is_figure_label(text: str, font_size: float, avg_size: float, block_bbox: li
 
 
 def is_chart_element(text: str, font_size: float, avg_size: float, block_bbox: list,
-                     page_width: float, page_height: float, drawing_rects: List[Tuple]) -> bool:
+                     page_width: float, page_height: float,
+                     drawing_rects: 'Union[np.ndarray, List[Tuple[float, float, float, float]]]') -> bool:
     """Detect if text block is part of a chart/figure element.
 
     Uses multiple heuristics:
     1. Text is near or inside graphic regions
     2. Text matches common chart patterns (axis labels, legend, model names)
     3. Small font size with short content
+
+    drawing_rects is the result of get_drawing_regions(): a list of
+    (x0, y0, x1, y1) tuples, or an (N, 4) numpy array on pages with many regions.
     """
     text = text.strip()
 
@@ -557,40 +754,28 @@ def is_chart_element(text: str, font_size: float, avg_size: float, block_bbox: l
         return True
 
     # Check if text is inside or near a drawing/graphic region
-    if len(block_bbox) >= 4 and drawing_rects:
+    if len(block_bbox) >= 4 and len(drawing_rects):
         bx0, by0, bx1, by1 = block_bbox[:4]
-        for rect in drawing_rects:
-            rx0, ry0, rx1, ry1 = rect
-            # Check if block is inside or overlaps with drawing
-            # with 20px margin for tolerance
-            margin = 20
-            if (bx0 >= rx0 - margin and bx1 <= rx1 + margin and
-                by0 >= ry0 - margin and by1 <= ry1 + margin):
+        # Check if block is inside or overlaps with drawing
+        # with 20px margin for tolerance
+        margin = 20
+        if np is not None and isinstance(drawing_rects, np.ndarray):
+            # Test all regions at once instead of looping in Python
+            inside = ((drawing_rects[:, 0] - margin <= bx0) & (drawing_rects[:, 2] + margin >= bx1) &
+                      (drawing_rects[:, 1] - margin <= by0) & (drawing_rects[:, 3] + margin >= by1))
+            if inside.any():
                 # Text is inside graphic region - likely chart element
                 return True
-
-    # Model names pattern (common in ML papers)
-    # e.g., "GPT-4o", "Llama 3 70B", "Yi 1.5 9B", "Qwen2 72B"
-    model_pattern = r'^(GPT|Llama|Yi|Qwen|Mistral|Mixtral|Meerkat|Internist|Claude|Gemini|PaLM)[\s\-]?[\d\.]+[a-zA-Z]*(\s+\d+[BbMmKk])?$'
-    if re.match(model_pattern, text, re.IGNORECASE):
-        return True
-
-    # Axis labels - numbers with units
-    # e.g., "20", "60", "Accuracy (%)", "Missing answer recall (%)"
-    if re.match(r'^\d{1,3}$', text):  # Standalone numbers (axis ticks)
-        return True
-
-    # Short text with parentheses containing % often axis label
-    if re.match(r'^[\w\s]+\s*\(%\)$', text) and len(text) < 30:
-        return True
-
-    # Sequence of reference numbers that look like axis ticks
-    # e.g., "^[30] ^[40] ^[50] ^[60] ^[70] ^[80]"
-    if re.match(r'^(\^?\[\d+\]\s*)+$', text):
-        return True
-
-    # Just reference numbers separated by spaces
-    if re.match(r'^(\d{1,3}\s+)+\d{1,3}$', text):
+        else:
+            for rect in drawing_rects:
+                rx0, ry0, rx1, ry1 = rect
+                if (bx0 >= rx0 - margin and bx1 <= rx1 + margin and
+                    by0 >= ry0 - margin and by1 <= ry1 + margin):
+                    # Text is inside graphic region - likely chart element
+                    return True
+
+    # Model names, axis ticks and labels, reference-number sequences
+    if _CHART_ELEMENT_UNION.match(text):
         return True
 
     # Very small font with short content = likely legend/label
@@ -602,10 +787,18 @@ def is_chart_element(text: str, font_size: float, avg_size: float, block_bbox: l
     return False
 
 
-def get_drawing_regions(page: 'fitz.Page') -> List[Tuple[float, float, float, float]]:
+# Below this many regions the per-rect loop in is_chart_element is faster
+# than numpy's fixed per-call overhead (break-even measured at ~50-64)
+NUMPY_MIN_DRAWING_RECTS = 64
+
+
+def get_drawing_regions(page: 'fitz.Page') -> 'Union[np.ndarray, List[Tuple[float, float, float, float]]]':
     """Extract bounding boxes of drawing/graphic regions from page.
 
-    Returns list of (x0, y0, x1, y1) tuples for graphic areas.
+    Returns (x0, y0, x1, y1) boxes for graphic areas as a list of tuples, or
+    as an (N, 4) numpy array when numpy is installed and there are at least
+    NUMPY_MIN_DRAWING_RECTS of them, so is_chart_element can test them in
+    one vectorized step.
     """
     drawing_rects = []
 
@@ -648,6 +841,8 @@ def get_drawing_regions(page: 'fitz.Page') -> List[Tuple[float, float, float, fl
     except Exception:
         pass
 
+    if np is not None and len(drawing_rects) >= NUMPY_MIN_DRAWING_RECTS:
+        return np.asarray(drawing_rects, dtype=np.float64)
     return drawing_rects
 
 
@@ -681,8 +876,12 @@ def merge_overlapping_rects(rects: List[Tuple], margin: float = 30) -> List[Tupl
     return merged
 
 
-def is_heading(block: Dict, page_blocks: List[Dict]) -> bool:
-    """Detect if a text block is a heading using generic heuristics."""
+def is_heading(block: Dict, page_blocks: List[Dict], avg_size: Optional[float] = None) -> bool:
+    """Detect if a text block is a heading using generic heuristics.
+
+    avg_size is the page's average font size; pass it when checking many
+    blocks of the same page to avoid recomputing it from page_blocks.
+    """
     if not block.get("lines"):
         return False
 
@@ -698,16 +897,17 @@ def is_heading(block: Dict, page_blocks: List[Dict]) -> bool:
     if len(text) < 3:
         return False
 
-    # Get average and max font sizes
-    all_sizes = []
-    for b in page_blocks:
-        for l in b.get("lines", []):
-            for s in l.get("spans", []):
-                size = s.get("size", 0)
-                if size > 0:
-                    all_sizes.append(size)
+    # Get average font size
+    if avg_size is None:
+        all_sizes = []
+        for b in page_blocks:
+            for l in b.get("lines", []):
+                for s in l.get("spans", []):
+                    size = s.get("size", 0)
+                    if size > 0:
+                        all_sizes.append(size)
 
-    avg_size = sum(all_sizes) / len(all_sizes) if all_sizes else 10
+        avg_size = sum(all_sizes) / len(all_sizes) if all_sizes else 10
 
     # Skip figure/chart labels
     block_bbox = block.get("bbox", [])
@@ -731,6 +931,10 @@ def is_heading(block: Dict, page_blocks: List[Dict]) -> bool:
     return False
 
 
+# Markdown heading prefixes indexed by detect_heading_level() (1-4)
+_HEADING_PREFIXES = tuple('\n' + '#' * level + ' ' for level in range(5))
+
+
 def detect_heading_level(font_size: float, max_size: float) -> int:
     """Determine heading level based on font size."""
     ratio = font_size / max_size if max_size > 0 else 0
@@ -750,35 +954,45 @@ def extract_images(doc: fitz.Document, output_dir: str, min_width: int = 100, mi
 
     page_images = {}
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
+    for page_num, page in enumerate(doc, 1):
         image_list = page.get_images()
-        page_images[page_num + 1] = []
+        images = page_images[page_num] = []
 
         for img_idx, img in enumerate(image_list):
             try:
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-
-                if base_image["width"] < min_width or base_image["height"] < min_height:
+                # get_images() entries are (xref, smask, width, height, ...),
+                # so small images are skipped without extracting them
+                xref, _, width, height = img[:4]
+                if width < min_width or height < min_height:
                     continue
 
+                # Write the embedded image bytes as-is, without decoding
+                base_image = doc.extract_image(xref)
                 image_bytes = base_image["image"]
                 image_ext = base_image["ext"]
 
-                image_filename = f"page{page_num + 1:03d}_img{img_idx:03d}.{image_ext}"
+                image_filename = f"page{page_num:03d}_img{img_idx:03d}.{image_ext}"
                 image_path = os.path.join(images_dir, image_filename)
 
                 with open(image_path, "wb") as f:
                     f.write(image_bytes)
 
-                page_images[page_num + 1].append(f"images/{image_filename}")
+                images.append(f"images/{image_filename}")
             except Exception:
                 continue
 
     return page_images
 
 
+_NUMERIC_RUN_SPLIT_RE = re.compile(r'(\d[\d.,%()+\-±]*|\s+)')
+_NUMERIC_OR_SPACE_RE = re.compile(r'^[\d.,%()+\-±\s]+$')
+_NUMERIC_TOKEN_RE = re.compile(r'^[\d.,%()+\-±]+$')
+_WORD_PART_SPLIT_RE = re.compile(r'(-|\d+|[,.:;])')
+# Punctuation followed by a letter, or a letter followed by a digit;
+# lookaheads keep the next char unconsumed so one replacement covers both
+_MISSING_SPACE_RE = re.compile(r'[.!?,;:](?=[A-Za-z])|[A-Za-z](?=\d)')
+
+
 def process_table_cell(cell_text: str) -> str:
     """Process a table cell: clean, add spaces, and format."""
     if not cell_text:
@@ -795,29 +1009,24 @@ def process_table_cell(cell_text: str) -> str:
     # Step 2: Check if this looks like broken text (most words are 1-2 chars)
     # Normal English has short words like "to", "the", "a" mixed with longer words
     # Broken text looks like "A ve ra ge con fi den ce" (almost all 1-2 char words)
-    words = text.split()
-    if len(words) > 3:
-        # Count words that are very short (1-2 chars) and alphabetic
-        alpha_words = [w for w in words if w.isalpha()]
-        if alpha_words:
-            very_short_count = sum(1 for w in alpha_words if len(w) <= 2)
-            very_short_ratio = very_short_count / len(alpha_words)
-            # Only fix if 80%+ of alphabetic words are 1-2 chars (clearly broken)
-            if very_short_ratio >= 0.8:
-                # Aggressive fix: remove all spaces from alphabetic sequences
-                # but preserve spaces around numbers and special chars
-                parts = re.split(r'(\d[\d.,%()+\-±]*|\s+)', text)
-                fixed_parts = []
-                for part in parts:
-                    if part and not re.match(r'^[\d.,%()+\-±\s]+$', part):
-                        # Alphabetic part - remove internal spaces
-                        part = part.replace(' ', '')
-                    fixed_parts.append(part)
-                text = ''.join(fixed_parts)
-                # Now add proper spaces back
-                text = add_spaces_to_concatenated_text(text)
+    words, very_short_ratio = very_short_alpha_ratio(text)
+    # Only fix if 80%+ of alphabetic words are 1-2 chars (clearly broken)
+    if len(words) > 3 and very_short_ratio >= 0.8:
+        # Aggressive fix: remove all spaces from alphabetic sequences
+        # but preserve spaces around numbers and special chars
+        parts = _NUMERIC_RUN_SPLIT_RE.split(text)
+        fixed_parts = []
+        for part in parts:
+            if part and not _NUMERIC_OR_SPACE_RE.match(part):
+                # Alphabetic part - remove internal spaces
+                part = part.replace(' ', '')
+            fixed_parts.append(part)
+        text = ''.join(fixed_parts)
+        # Now add proper spaces back
+        text = add_spaces_to_concatenated_text(text)
 
     # Step 3: Apply fix_broken_spaces for remaining issues
+    # (reuses the cached word split when Step 2 left the text unchanged)
     text = fix_broken_spaces(text)
 
     # Step 4: Process each word individually - some may still be concatenated
@@ -825,68 +1034,41 @@ def process_table_cell(cell_text: str) -> str:
     processed_words = []
     for word in words:
         # Skip numbers and very short words
-        if len(word) < 6 or re.match(r'^[\d.,%()+\-±]+$', word):
+        if len(word) < 6 or _NUMERIC_TOKEN_RE.match(word):
             processed_words.append(word)
             continue
 
         # Try wordninja for potentially concatenated words
         # Only for purely alphabetic words
-        if wordninja is not None and word.isalpha():
-            split_words = wordninja.split(word)
+        if _HAS_WORDNINJA and word.isalpha():
+            split_words = wordninja_split(word)
             # Only accept split if:
             # 1. Actually split into multiple words
             # 2. Short words (2 chars) must be valid English words, not suffix artifacts
             # 3. Average word length is reasonable (3+)
             if len(split_words) > 1:
-                # Valid 1-2 letter English words (not suffix artifacts)
-                valid_1char = {'a', 'i'}  # Valid single-letter words
-                valid_2char = {'is', 'as', 'no', 'to', 'be', 'we', 'he', 'me', 'it', 'in', 'on',
-                               'or', 'an', 'at', 'by', 'do', 'go', 'if', 'of', 'so', 'up', 'my'}
-                # Suffix artifacts that indicate bad splits
-                suffix_artifacts = {'al', 'ed', 'er', 'ly', 'es', 'en', 'le', 'el', 'ic', 'ty'}
-                # Check each word: must be 3+ chars OR a valid 1-2 char word
-                all_valid = all(
-                    len(w) >= 3 or
-                    (len(w) == 2 and w.lower() in valid_2char) or
-                    (len(w) == 1 and w.lower() in valid_1char)  # Allow "a", "A", "i", "I"
-                    for w in split_words
-                )
-                # Reject if any word is a suffix artifact
-                has_artifact = any(len(w) == 2 and w.lower() in suffix_artifacts for w in split_words)
                 # First word should be 2+ chars (or 1 char if uppercase)
                 first_ok = len(split_words[0]) >= 2 or (len(split_words[0]) == 1 and split_words[0].isupper())
                 # Last word should NOT be a suffix artifact
-                last_ok = len(split_words[-1]) >= 3 or split_words[-1].lower() in valid_2char
-                if all_valid and not has_artifact and first_ok and last_ok:
+                last_ok = len(split_words[-1]) >= 3 or split_words[-1].lower() in VALID_2CHAR_WORDS
+                if first_ok and last_ok and is_valid_wordninja_split(split_words):
                     word = ' '.join(split_words)
                     processed_words.append(word)
                     continue
 
         # For long words (15+) with mixed content (letters + hyphens/numbers/punctuation)
         # Try to split alphabetic parts individually
-        if len(word) > 15 and wordninja is not None:
+        if len(word) > 15 and _HAS_WORDNINJA:
             # Split on hyphens, numbers, and common punctuation, process each alphabetic part
-            parts = re.split(r'(-|\d+|[,.:;])', word)
+            parts = _WORD_PART_SPLIT_RE.split(word)
             new_parts = []
             for part in parts:
                 if part and part.isalpha() and len(part) > 10:
                     # Try wordninja on this alphabetic part
-                    split_result = wordninja.split(part)
-                    if len(split_result) > 1:
-                        # Apply same quality checks
-                        valid_1char = {'a', 'i'}
-                        valid_2char = {'is', 'as', 'no', 'to', 'be', 'we', 'he', 'me', 'it', 'in', 'on',
-                                       'or', 'an', 'at', 'by', 'do', 'go', 'if', 'of', 'so', 'up', 'my'}
-                        suffix_artifacts = {'al', 'ed', 'er', 'ly', 'es', 'en', 'le', 'el', 'ic', 'ty'}
-                        all_valid = all(
-                            len(w) >= 3 or
-                            (len(w) == 2 and w.lower() in valid_2char) or
-                            (len(w) == 1 and w.lower() in valid_1char)
-                            for w in split_result
-                        )
-                        has_artifact = any(len(w) == 2 and w.lower() in suffix_artifacts for w in split_result)
-                        if all_valid and not has_artifact:
-                            part = ' '.join(split_result)
+                    split_result = wordninja_split(part)
+                    # Apply same quality checks
+                    if len(split_result) > 1 and is_valid_wordninja_split(split_result):
+                        part = ' '.join(split_result)
                 new_parts.append(part)
             word = ''.join(new_parts)
 
@@ -898,99 +1080,71 @@ def process_table_cell(cell_text: str) -> str:
 
     text = ' '.join(processed_words)
 
-    # Post-processing: Add space after punctuation if missing
-    # "accident.Soon" -> "accident. Soon"
-    # "hospitalization,he" -> "hospitalization, he"
-    text = re.sub(r'([.!?])([A-Za-z])', r'\1 \2', text)
-    text = re.sub(r'([,;:])([A-Za-z])', r'\1 \2', text)
-
-    # Add space between letter and number when directly adjacent
-    # "A58" -> "A 58" (but preserve patterns like "COVID-19")
-    text = re.sub(r'([A-Za-z])(\d)', r'\1 \2', text)
+    # Post-processing in a single pass:
+    # - Add space after punctuation if missing
+    #   "accident.Soon" -> "accident. Soon"
+    #   "hospitalization,he" -> "hospitalization, he"
+    # - Add space between letter and number when directly adjacent
+    #   "A58" -> "A 58" (but preserve patterns like "COVID-19")
+    text = _MISSING_SPACE_RE.sub(r'\g<0> ', text)
 
     # Clean up multiple spaces
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = ' '.join(text.split())
 
     return text
 
 
-def extract_table_text_with_tolerance(page, bbox: Tuple, x_tolerance: float = 1.5) -> List[List[str]]:
-    """Extract table text using custom x_tolerance for better word separation.
-
-    Args:
-        page: pdfplumber page object
-        bbox: Table bounding box (x0, y0, x1, y1)
-        x_tolerance: Character spacing threshold for word separation
-
-    Returns:
-        List of rows, each row is a list of cell texts
-    """
-    cropped = page.crop(bbox)
-    text = cropped.extract_text(x_tolerance=x_tolerance, y_tolerance=3)
-
-    if not text:
-        return []
-
-    # Split into lines and return as single-column table
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    return [[line] for line in lines]
+@lru_cache(maxsize=64)
+def table_separator_row(ncols: int) -> str:
+    """Markdown table separator row for `ncols` columns."""
+    return '| ' + ' | '.join(['---'] * ncols) + ' |'
 
 
-def extract_tables_from_page(page_num: int, pdf_path: str) -> Tuple[List[str], List[Tuple[float, float, float, float]]]:
-    """Extract tables from a page using pdfplumber.
+def extract_tables_from_page(page: fitz.Page) -> Tuple[List[str], List[Tuple[float, float, float, float]]]:
+    """Extract tables from a page using PyMuPDF's native table finder.
     Returns (table_markdowns, table_bboxes) where bbox is (x0, y0, x1, y1)."""
-    if pdfplumber is None:
-        return [], []
-
     tables_md = []
     table_bboxes = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if page_num <= len(pdf.pages):
-                page = pdf.pages[page_num - 1]
-
-                tables = page.find_tables()
-
-                for table in tables:
-                    # Get table bounding box
-                    bbox = table.bbox  # (x0, y0, x1, y1)
+        # Page.find_tables() requires PyMuPDF 1.23+
+        tables = page.find_tables()
 
-                    # Try x_tolerance-based extraction first (better word separation)
-                    table_data = extract_table_text_with_tolerance(page, bbox, x_tolerance=1.5)
+        for table in tables:
+            # Get table bounding box
+            bbox = tuple(table.bbox)  # (x0, y0, x1, y1)
 
-                    # Fall back to default extraction if x_tolerance method fails
-                    if not table_data or len(table_data) < 2:
-                        table_data = table.extract()
+            table_data = table.extract()
 
-                    # Validate table before processing
-                    if not validate_table(table_data):
-                        # Still add bbox to exclude from text extraction
-                        # but don't generate markdown for invalid tables
-                        table_bboxes.append(bbox)
-                        continue
+            # Validate table before processing
+            if not validate_table(table_data):
+                # Still add bbox to exclude from text extraction
+                # but don't generate markdown for invalid tables
+                table_bboxes.append(bbox)
+                continue
 
-                    table_bboxes.append(bbox)
+            table_bboxes.append(bbox)
 
-                    md_lines = []
-                    # Header - process each cell
-                    header = [process_table_cell(cell) for cell in table_data[0]]
+            md_lines = []
+            # Header - process each cell
+            header = [process_table_cell(cell) for cell in table_data[0]]
 
-                    # Skip tables with all empty headers
-                    if all(not h for h in header):
-                        continue
+            # Skip tables with all empty headers
+            if all(not h for h in header):
+                continue
 
-                    md_lines.append('| ' + ' | '.join(header) + ' |')
-                    md_lines.append('| ' + ' | '.join(['---'] * len(header)) + ' |')
+            ncols = len(header)
+            md_lines.append('| ' + ' | '.join(header) + ' |')
+            md_lines.append(table_separator_row(ncols))
 
-                    # Rows
-                    for row in table_data[1:]:
-                        cells = [process_table_cell(cell) for cell in row]
-                        # Pad if needed
-                        while len(cells) < len(header):
-                            cells.append('')
-                        md_lines.append('| ' + ' | '.join(cells[:len(header)]) + ' |')
+            # Rows: fill a header-sized list, so short rows are padded with ''
+            # and cells beyond the header are never processed
+            for row in table_data[1:]:
+                cells = [''] * ncols
+                for i, cell in enumerate(row[:ncols]):
+                    cells[i] = process_table_cell(cell)
+                md_lines.append('| ' + ' | '.join(cells) + ' |')
 
-                    tables_md.append('\n'.join(md_lines))
+            tables_md.append('\n'.join(md_lines))
     except Exception:
         pass
 
@@ -999,17 +1153,9 @@ def extract_tables_from_page(page_num: int, pdf_path: str) -> Tuple[List[str], L
 
 def bbox_overlaps(bbox1: Tuple[float, float, float, float], bbox2: Tuple[float, float, float, float], margin: float = 5.0) -> bool:
     """Check if two bounding boxes overlap (with margin for tolerance)."""
-    x0_1, y0_1, x1_1, y1_1 = bbox1
-    x0_2, y0_2, x1_2, y1_2 = bbox2
-
-    # Add margin tolerance
-    x0_2 -= margin
-    y0_2 -= margin
-    x1_2 += margin
-    y1_2 += margin
-
-    # Check if boxes overlap
-    return not (x1_1 < x0_2 or x0_1 > x1_2 or y1_1 < y0_2 or y0_1 > y1_2)
+    # Index directly instead of unpacking; this runs per block per table
+    return not (bbox1[2] < bbox2[0] - margin or bbox1[0] > bbox2[2] + margin or
+                bbox1[3] < bbox2[1] - margin or bbox1[1] > bbox2[3] + margin)
 
 
 def is_superscript_span(span: Dict, base_font_size: float) -> bool:
@@ -1028,35 +1174,33 @@ def is_superscript_span(span: Dict, base_font_size: float) -> bool:
     return False
 
 
-def extract_line_with_superscripts(line: Dict, base_font_size: float) -> str:
-    """Extract line text with proper superscript handling."""
-    result_parts = []
-    spans = line.get("spans", [])
+def is_ref_number(text: str) -> bool:
+    """Check if text is a reference number list like "1", "1,2" or "3–5"."""
+    return bool(text) and all(c.isdecimal() or c in ',–-' for c in text)
 
-    for i, span in enumerate(spans):
-        text = span.get("text", "")
-        if not text:
-            continue
 
-        if is_superscript_span(span, base_font_size):
-            # Check if it's a reference number (digits only)
-            if re.match(r'^[\d,–-]+$', text.strip()):
-                # Format as reference: ^[1] or ^[1,2]
-                result_parts.append(f"^[{text.strip()}]")
-            else:
-                result_parts.append(text)
-        else:
-            result_parts.append(text)
+def format_span_text(span: Dict, base_font_size: float) -> str:
+    """Return span text, formatting superscript reference numbers as ^[n]."""
+    text = span.get("text", "")
+    if text and is_superscript_span(span, base_font_size):
+        # Check if it's a reference number (digits only)
+        if is_ref_number(text.strip()):
+            # Format as reference: ^[1] or ^[1,2]
+            return f"^[{text.strip()}]"
+    return text
 
-    return ''.join(result_parts)
 
+def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple[float, float, float, float]] = None,
+                      text_dict: Optional[Dict] = None) -> Tuple[str, List[Dict]]:
+    """Extract text from a page as Markdown, excluding text in specified bounding boxes.
 
-def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple[float, float, float, float]] = None) -> Tuple[str, List[Dict]]:
-    """Extract text from a page as Markdown, excluding text in specified bounding boxes."""
+    Pass `text_dict` to reuse an already computed page.get_text("dict").
+    """
     if exclude_bboxes is None:
         exclude_bboxes = []
 
-    text_dict = page.get_text("dict")
+    if text_dict is None:
+        text_dict = page.get_text("dict")
     blocks = text_dict.get("blocks", [])
     page_height = page.rect.height
     page_width = page.rect.width
@@ -1067,17 +1211,19 @@ def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple
     # Filter text blocks only
     text_blocks = [b for b in blocks if b.get("type") == 0]
 
-    # Calculate base font size (most common size)
+    # Calculate base (most common), max and average font sizes in one pre-pass
     font_sizes = []
+    sizes_append = font_sizes.append
     for block in text_blocks:
         for line in block.get("lines", []):
             for span in line.get("spans", []):
                 size = span.get("size", 0)
                 if size > 0:
-                    font_sizes.append(size)
+                    sizes_append(size)
 
-    base_font_size = max(set(font_sizes), key=font_sizes.count) if font_sizes else 10
+    base_font_size = Counter(font_sizes).most_common(1)[0][0] if font_sizes else 10
     max_font_size = max(font_sizes) if font_sizes else 12
+    avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 10
 
     lines = []
     block_info = []
@@ -1086,52 +1232,52 @@ def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple
     header_margin = page_height * 0.08
     footer_margin = page_height * 0.92
 
+    # Table bboxes sorted by top edge (minus margin), so each block only
+    # tests the tables that start above its bottom edge
+    table_margin = 10.0
+    sorted_tables = sorted(exclude_bboxes, key=lambda b: b[1])
+    table_tops = [b[1] - table_margin for b in sorted_tables]
+
     for block in text_blocks:
         block_bbox = block.get("bbox", [0, 0, 0, 0])
+        in_margin = False
 
-        # Skip blocks in header/footer region
         if len(block_bbox) >= 4:
-            block_top = block_bbox[1]
-            block_bottom = block_bbox[3]
-
-            # Check if block is in header region (top 8%)
-            if block_top < header_margin:
-                # Only filter if it looks like header text
-                block_text_check = ""
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        block_text_check += span.get("text", "")
-                if is_header_footer(block_text_check):
-                    continue
-
-            # Check if block is in footer region (bottom 8%)
-            if block_bottom > footer_margin:
-                block_text_check = ""
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        block_text_check += span.get("text", "")
-                if is_header_footer(block_text_check):
-                    continue
-
             # Check overlap with table bboxes
             skip_block = False
-            for table_bbox in exclude_bboxes:
-                if bbox_overlaps(tuple(block_bbox), table_bbox, margin=10.0):
+            for i in range(bisect_right(table_tops, block_bbox[3])):
+                if bbox_overlaps(block_bbox, sorted_tables[i], margin=table_margin):
                     skip_block = True
                     break
             if skip_block:
                 continue
 
-        # Extract text with superscript handling
+            # Block is in header region (top 8%) or footer region (bottom 8%)
+            in_margin = block_bbox[1] < header_margin or block_bbox[3] > footer_margin
+
+        # Skip blocks in header/footer region, but only if they look like
+        # header/footer text; the raw text is only built for margin blocks
+        if in_margin and is_header_footer(''.join(
+                span.get("text", "") for line in block.get("lines", []) for span in line.get("spans", []))):
+            continue
+
+        # Single pass over the spans: line text with superscript handling
+        # and the block's font size
         block_lines = []
         block_font_size = 0
 
         for line in block.get("lines", []):
-            line_text = extract_line_with_superscripts(line, base_font_size)
+            line_parts = []
+            for span in line.get("spans", []):
+                size = span.get("size", 0)
+                if size > block_font_size:
+                    block_font_size = size
+                text = span.get("text", "")
+                if text:
+                    line_parts.append(format_span_text(span, base_font_size))
+            line_text = ''.join(line_parts)
             if line_text:
                 block_lines.append(line_text)
-            for span in line.get("spans", []):
-                block_font_size = max(block_font_size, span.get("size", 0))
 
         block_text = ' '.join(block_lines)  # Join lines with space instead of newline
         block_text = block_text.strip()
@@ -1149,13 +1295,13 @@ def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple
             continue
 
         # Check if heading
-        is_head = is_heading(block, text_blocks)
+        is_head = is_heading(block, text_blocks, avg_font_size)
 
         if is_head:
             level = detect_heading_level(block_font_size, max_font_size)
-            lines.append(f"\n{'#' * level} {block_text}\n")
+            lines.append(_HEADING_PREFIXES[level] + block_text + '\n')
         else:
-            lines.append(f"\n{block_text}\n")
+            lines.append('\n' + block_text + '\n')
 
         block_info.append({
             "text": block_text,
@@ -1166,16 +1312,20 @@ def extract_page_text(page: fitz.Page, page_num: int, exclude_bboxes: List[Tuple
     return '\n'.join(lines), block_info
 
 
-def extract_metadata(doc: fitz.Document, pdf_path: str) -> DocumentMetadata:
-    """Extract document metadata."""
+def extract_metadata(doc: fitz.Document, pdf_path: str, first_page_dict: Optional[Dict] = None) -> DocumentMetadata:
+    """Extract document metadata.
+
+    Pass `first_page_dict` to reuse an already computed doc[0].get_text("dict").
+    """
     meta = doc.metadata or {}
 
     title = meta.get("title", "")
     if not title:
         # Try to get title from first page
         if len(doc) > 0:
-            page = doc[0]
-            text_dict = page.get_text("dict")
+            text_dict = first_page_dict
+            if text_dict is None:
+                text_dict = doc[0].get_text("dict")
             blocks = [b for b in text_dict.get("blocks", []) if b.get("type") == 0]
 
             max_size = 0
@@ -1211,6 +1361,38 @@ target_language: {target_lang}
 '''
 
 
+# Multi-language reference section headers
+REF_HEADERS = [
+    r'References', r'Bibliography', r'Works\s+Cited', r'Literature',
+    r'참고문헌', r'참고\s*문헌',
+    r'Literatur(?:verzeichnis)?',
+    r'Références', r'Bibliographie',
+    r'Referencias', r'Bibliografía',
+    r'参考文献', r'引用文献',
+]
+
+# Matches any reference header and the section body up to the next heading
+_REF_SECTION_RE = re.compile(
+    rf'(#{{1,3}}\s*(?:{"|".join(REF_HEADERS)})\s*\n)(.*?)(?=\n#{{1,3}}\s|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_REF_NUMBER_LINE_RE = re.compile(r'\n(\d{1,3})\.\s*\n')
+
+# Lowercase substrings of which every REF_HEADERS match contains at least
+# one; they avoid 'i' and 's', whose case-insensitive matches include
+# characters (e.g. 'ſ') that str.lower() does not map back
+_REF_HEADER_KEYWORDS = ('referenc', 'référenc', 'ograph', 'ograf', 'work', 'teratur',
+                        '참고', '参考文献', '引用文献')
+
+
+def is_ref_entry_start(line: str) -> bool:
+    """Check if line starts a numbered reference entry: 1-3 digits, a dot, then whitespace."""
+    i = 0
+    while i < 3 and i < len(line) and line[i].isdecimal():
+        i += 1
+    return i > 0 and line[i:i + 1] == '.' and line[i + 1:i + 2].isspace()
+
+
 def post_process_references(markdown: str) -> str:
     """Post-process the References section for better formatting.
 
@@ -1223,20 +1405,15 @@ def post_process_references(markdown: str) -> str:
     - Chinese: 参考文献
     - Japanese: 参考文献, 引用文献
     """
-    # Multi-language reference section headers
-    ref_headers = [
-        r'References', r'Bibliography', r'Works\s+Cited', r'Literature',
-        r'참고문헌', r'참고\s*문헌',
-        r'Literatur(?:verzeichnis)?',
-        r'Références', r'Bibliographie',
-        r'Referencias', r'Bibliografía',
-        r'参考文献', r'引用文献',
-    ]
-
-    # Build pattern to match any reference header
-    header_pattern = '|'.join(ref_headers)
-    ref_pattern = rf'(#{{1,3}}\s*(?:{header_pattern})\s*\n)(.*?)(?=\n#{{1,3}}\s|\Z)'
-    match = re.search(ref_pattern, markdown, re.DOTALL | re.IGNORECASE)
+    # Cheap checks before the full section search: it needs a heading and
+    # one of the header keywords
+    if '#' not in markdown:
+        return markdown
+    lower = markdown.lower()
+    if not any(keyword in lower for keyword in _REF_HEADER_KEYWORDS):
+        return markdown
+
+    match = _REF_SECTION_RE.search(markdown)
 
     if not match:
         return markdown
@@ -1246,7 +1423,7 @@ def post_process_references(markdown: str) -> str:
 
     # Fix reference entries where number is on separate line
     # Pattern: "\n1.\n" or "\n12.\n" followed by text
-    ref_content = re.sub(r'\n(\d{1,3})\.\s*\n', r'\n\1. ', ref_content)
+    ref_content = _REF_NUMBER_LINE_RE.sub(r'\n\1. ', ref_content)
 
     # Merge lines within a reference entry (lines not starting with number)
     lines = ref_content.split('\n')
@@ -1263,7 +1440,7 @@ def post_process_references(markdown: str) -> str:
             continue
 
         # Check if line starts a new reference (number followed by dot)
-        if re.match(r'^\d{1,3}\.\s', stripped):
+        if is_ref_entry_start(stripped):
             if current_ref:
                 merged_lines.append(current_ref)
             current_ref = stripped
@@ -1283,32 +1460,131 @@ def post_process_references(markdown: str) -> str:
     return markdown[:match.start()] + ref_header + new_ref_content + markdown[match.end():]
 
 
+# One scan for three fixups:
+# - dup: duplicate page markers
+# - gap/heading: excessive whitespace before headings
+# - orphan: orphaned superscript numbers at start of paragraphs
+_POSTPROCESS_RE = re.compile(
+    r'(?P<dup><!-- Page \d+ -->)\s*(?P=dup)'
+    r'|(?P<gap>\n{3,})(?P<heading>#)'
+    r'|(?P<orphan>\n\^?\[?\d{1,2}\]?\s*\n)'
+)
+
+
+def _postprocess_replace(match: re.Match) -> str:
+    if match.group('dup'):
+        return match.group('dup')
+    if match.group('gap'):
+        return '\n\n' + match.group('heading')
+    return '\n'
+
+
 def post_process_markdown(markdown: str) -> str:
     """Apply all post-processing to the extracted markdown."""
     # Process references section
     markdown = post_process_references(markdown)
 
-    # Remove duplicate page markers
-    markdown = re.sub(r'(<!-- Page \d+ -->)\s*\1', r'\1', markdown)
+    # Remove duplicate page markers, clean up excessive whitespace around
+    # headings and remove orphaned superscript numbers in a single pass
+    markdown = _POSTPROCESS_RE.sub(_postprocess_replace, markdown)
 
-    # Clean up excessive whitespace around headings
-    markdown = re.sub(r'\n{3,}(#)', r'\n\n\1', markdown)
+    return markdown
 
-    # Remove orphaned superscript numbers at start of paragraphs
-    markdown = re.sub(r'\n\^?\[?\d{1,2}\]?\s*\n', '\n', markdown)
 
-    return markdown
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
 
+# Page extraction runs in worker processes; each worker gets at least this
+# many pages so the cost of starting it and reopening the PDF pays off
+MAX_WORKERS = 8
+MIN_PAGES_PER_WORKER = 4
 
-def extract_to_markdown(pdf_path: str, output_dir: str, source_lang: str = "auto", target_lang: str = "ko") -> Dict[str, Any]:
+
+def iter_page_range(pdf_path: str, page_nums: List[int],
+                    first_page_dict: Optional[Dict] = None) -> Iterator[Tuple[int, str, List[str]]]:
+    """Yield (page_num, page_text, table_markdowns) for a contiguous range of pages.
+
+    The PDF is opened here once for the whole range. `first_page_dict` is
+    reused as page 1's text dict when that page is in the range.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in page_nums:
+            page = doc[page_num - 1]
+
+            # Extract tables first and get their bounding boxes
+            tables, table_bboxes = extract_tables_from_page(page)
+
+            # Extract text, excluding text that overlaps with table regions
+            text_dict = first_page_dict if page_num == 1 else None
+            page_text, _ = extract_page_text(page, page_num, exclude_bboxes=table_bboxes, text_dict=text_dict)
+
+            yield page_num, page_text, tables
+    finally:
+        doc.close()
+
+
+def process_page_range(pdf_path: str, page_nums: List[int]) -> List[Tuple[int, str, List[str]]]:
+    """Worker-process entry point: extract a page range and return the results as a list."""
+    return list(iter_page_range(pdf_path, page_nums))
+
+
+def extract_pages(pdf_path: str, page_count: int, workers: Optional[int] = None,
+                  first_page_dict: Optional[Dict] = None) -> Iterator[Tuple[int, str, List[str]]]:
+    """Yield (page_num, page_text, table_markdowns) for every page, in page order.
+
+    Pages are split into contiguous ranges processed in parallel by up to
+    `workers` processes (default: CPU count, capped at MAX_WORKERS). Ranges
+    are yielded as soon as they and all earlier ranges are done, so callers
+    can write output while later pages are still being extracted. Falls
+    back to extracting serially when a process pool cannot be created.
+    `first_page_dict` is only reused when pages are extracted in-process.
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, MAX_WORKERS)
+    workers = max(1, min(workers, -(-page_count // MIN_PAGES_PER_WORKER)))
+
+    page_nums = list(range(1, page_count + 1))
+    if workers == 1:
+        yield from iter_page_range(pdf_path, page_nums, first_page_dict)
+        return
+
+    chunk_size = -(-page_count // workers)
+    ranges = [page_nums[i:i + chunk_size] for i in range(0, page_count, chunk_size)]
+
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (ImportError, OSError, NotImplementedError):
+        # No working multiprocessing here (e.g. no sem_open or /dev/shm)
+        yield from iter_page_range(pdf_path, page_nums, first_page_dict)
+        return
+
+    with executor:
+        # first_page_dict is not sent to the workers: it can hold raw image
+        # bytes, and pickling it costs more than re-parsing page 1 there
+        futures = [executor.submit(process_page_range, pdf_path, r) for r in ranges]
+        for future in futures:
+            yield from future.result()
+
+
+def extract_to_markdown(pdf_path: str, output_dir: str, source_lang: str = "auto", target_lang: str = "ko",
+                        workers: Optional[int] = None) -> Dict[str, Any]:
     """Extract PDF to Markdown with images."""
 
     os.makedirs(output_dir, exist_ok=True)
 
+    # Running headers/footers repeat on every page, so these checks are
+    # cached per document
+    is_header_footer.cache_clear()
+    filter_artifact_text.cache_clear()
+
     doc = fitz.open(pdf_path)
 
+    # Page 1's text dict is needed by both the title fallback and the text
+    # extraction, so build it once and share it
+    first_page_dict = doc[0].get_text("dict") if len(doc) > 0 else None
+
     # Extract metadata
-    metadata = extract_metadata(doc, pdf_path)
+    metadata = extract_metadata(doc, pdf_path, first_page_dict)
     print(f"Title: {metadata.title}")
     print(f"Pages: {metadata.page_count}")
 
@@ -1318,50 +1594,50 @@ def extract_to_markdown(pdf_path: str, output_dir: str, source_lang: str = "auto
     image_count = sum(len(imgs) for imgs in page_images.values())
     print(f"Extracted {image_count} images")
 
-    # Extract text and build markdown
-    print("Extracting text...")
-    markdown_parts = [generate_frontmatter(metadata, source_lang, target_lang)]
-
-    if metadata.title:
-        markdown_parts.append(f"# {metadata.title}\n\n")
+    # Pre-format each page's image markdown once, outside the page loop
+    page_image_md = {
+        page_num: ''.join(f"\n\n![Image]({img_path})\n" for img_path in imgs)
+        for page_num, imgs in page_images.items() if imgs
+    }
 
-    for page_num in range(1, len(doc) + 1):
-        page = doc[page_num - 1]
+    # Extract text and stream markdown to disk page by page, so the whole
+    # document is never held as a list of parts plus a joined copy
+    print("Extracting text...")
+    output_path = os.path.join(output_dir, "source.md")
 
-        # Page anchor
-        markdown_parts.append(f'\n<!-- Page {page_num} -->\n')
+    # newline='' keeps the text byte-identical when it is read back below
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(generate_frontmatter(metadata, source_lang, target_lang))
 
-        # Extract tables first and get their bounding boxes
-        tables, table_bboxes = extract_tables_from_page(page_num, pdf_path)
+        if metadata.title:
+            f.write(f"\n# {metadata.title}\n\n")
 
-        # Extract text, excluding text that overlaps with table regions
-        page_text, _ = extract_page_text(page, page_num, exclude_bboxes=table_bboxes)
-        markdown_parts.append(page_text)
+        for page_num, page_text, tables in extract_pages(pdf_path, len(doc), workers, first_page_dict):
+            # Page anchor
+            f.write(f'\n\n<!-- Page {page_num} -->\n')
+            f.write('\n' + page_text)
 
-        # Add tables (already extracted, no duplication)
-        for table_md in tables:
-            markdown_parts.append(f"\n{table_md}\n")
+            # Add tables (already extracted, no duplication)
+            for table_md in tables:
+                f.write(f"\n\n{table_md}\n")
 
-        # Add images
-        for img_path in page_images.get(page_num, []):
-            markdown_parts.append(f"\n![Image]({img_path})\n")
+            # Add images
+            f.write(page_image_md.get(page_num, ''))
 
-    # Combine and clean
-    markdown = '\n'.join(markdown_parts)
-    markdown = re.sub(r'\n{4,}', '\n\n\n', markdown)
+    # Whole-document cleanup and post-processing in a second stage
+    with open(output_path, 'r', encoding='utf-8', newline='') as f:
+        markdown = f.read()
 
-    # Apply post-processing
+    markdown = _EXCESS_NEWLINES_RE.sub('\n\n\n', markdown)
     markdown = post_process_markdown(markdown)
 
-    # Save markdown
-    output_path = os.path.join(output_dir, "source.md")
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(markdown)
 
     # Save metadata
     meta_path = os.path.join(output_dir, "metadata.json")
     with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(asdict(metadata), f, ensure_ascii=False, indent=2)
+        json.dump(metadata.to_dict(), f, ensure_ascii=False, indent=2)
 
     doc.close()
 
@@ -1369,7 +1645,7 @@ def extract_to_markdown(pdf_path: str, output_dir: str, source_lang: str = "auto
 
     return {
         "markdown_path": output_path,
-        "metadata": asdict(metadata),
+        "metadata": metadata.to_dict(),
         "image_count": image_count,
         "page_count": metadata.page_count
     }
@@ -1381,6 +1657,8 @@ def main():
     parser.add_argument('--output-dir', required=True, help='Output directory')
     parser.add_argument('--source-lang', default='auto', help='Source language')
     parser.add_argument('--target-lang', default='ko', help='Target language')
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f'Worker processes for page extraction (default: CPU count, max {MAX_WORKERS})')
     args = parser.parse_args()
 
     if not os.path.exists(args.pdf):
@@ -1391,7 +1669,8 @@ def main():
         args.pdf,
         args.output_dir,
         args.source_lang,
-        args.target_lang
+        args.target_lang,
+        args.workers
     )
 
     print(f"\nExtraction complete:")
@@ -4,6 +4,8 @@
 import argparse
 import os
 import subprocess
+import tempfile
+from pathlib import Path
 
 try:
     from weasyprint import HTML
@@ -168,29 +170,21 @@ def check_pandoc():
         return False
 
 
-def markdown_to_html(markdown_path: str) -> str:
-    """Convert Markdown to HTML using pandoc."""
-    # Use markdown+strikeout to support ~~strikethrough~~ syntax
-    result = subprocess.run(
-        ['pandoc', markdown_path, '-f', 'markdown+strikeout', '-t', 'html5'],
-        capture_output=True,
-        text=True
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"pandoc failed: {result.stderr}")
-
-    # Wrap in complete HTML document with our styles
-    html_body = result.stdout
-    return f'''<!DOCTYPE html>
+# Minimal pandoc template: the same document wrapper as a plain HTML body
+# plus our <style> block, without the default template's title block
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8">
-<style>{CSS_STYLE}</style>
+$for(header-includes)$
+$header-includes$
+$endfor$
 </head>
 <body>
-{html_body}
+$body$
 </body>
-</html>'''
+</html>
+"""
 
 
 def generate_pdf(markdown_path: str, output_path: str):
@@ -201,16 +195,46 @@ def generate_pdf(markdown_path: str, output_path: str):
 
     print(f"Converting: {markdown_path}")
 
-    # Convert Markdown to HTML
-    html_content = markdown_to_html(markdown_path)
-
-    # Get base directory for resolving relative image paths
-    base_dir = os.path.dirname(os.path.abspath(markdown_path))
-    base_url = f'file://{base_dir}/'
+    # Get base directory for resolving relative image paths; as_uri()
+    # percent-encodes spaces and other characters a file:// URL can't hold
+    md_path = Path(markdown_path).resolve()
+    base_url = md_path.parent.as_uri() + '/'
+
+    # Let pandoc emit the complete HTML document with our styles and pipe it
+    # straight into weasyprint, instead of buffering and re-wrapping it here.
+    # Use markdown+strikeout to support ~~strikethrough~~ syntax.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template_path = os.path.join(tmp_dir, 'template.html')
+        with open(template_path, 'w', encoding='utf-8') as f:
+            f.write(HTML_TEMPLATE)
+        header_path = os.path.join(tmp_dir, 'style.html')
+        with open(header_path, 'w', encoding='utf-8') as f:
+            f.write(f"<style>{CSS_STYLE}</style>\n")
+
+        # stderr goes to a temp file so pandoc never blocks on a full pipe
+        with tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(
+                ['pandoc', str(md_path), '-f', 'markdown+strikeout', '-t', 'html5', '-s',
+                 '--template', template_path, '-H', header_path],
+                stdout=subprocess.PIPE,
+                stderr=err
+            )
+
+            # Create PDF with weasyprint
+            print("Generating PDF with weasyprint...")
+            try:
+                with proc.stdout:
+                    html = HTML(file_obj=proc.stdout, base_url=base_url)
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                returncode = proc.wait()
+
+            if returncode != 0:
+                err.seek(0)
+                raise RuntimeError(f"pandoc failed: {err.read().decode('utf-8', errors='replace')}")
 
-    # Create PDF with weasyprint
-    print("Generating PDF with weasyprint...")
-    html = HTML(string=html_content, base_url=base_url)
     html.write_pdf(output_path)
 
     print(f"PDF saved: {output_path}")
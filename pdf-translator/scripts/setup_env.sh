@@ -7,7 +7,9 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
 VENV_DIR="${PROJECT_DIR}/.venv"
-REQUIREMENTS="pymupdf pdfplumber weasyprint"
+REQUIREMENTS="pymupdf>=1.23 weasyprint"
+# Optional speedups; the scripts fall back to pure Python without them
+OPTIONAL_REQUIREMENTS="pyahocorasick"
 
 echo "Setting up PDF translation environment..."
 
@@ -43,7 +45,7 @@ fi
 
 # Check if virtual environment already exists and has packages
 if [ -d "$VENV_DIR" ] && [ -f "$VENV_DIR/bin/python" ]; then
-    if "$VENV_DIR/bin/python" -c "import fitz, pdfplumber, weasyprint" 2>/dev/null; then
+    if "$VENV_DIR/bin/python" -c "import fitz, weasyprint" 2>/dev/null; then
         echo "Environment already set up at $VENV_DIR"
         echo "Python: $VENV_DIR/bin/python"
         exit 0
@@ -61,6 +63,7 @@ if command -v uv &> /dev/null; then
 
     # Install dependencies
     uv pip install --python "$VENV_DIR/bin/python" $REQUIREMENTS
+    uv pip install --python "$VENV_DIR/bin/python" $OPTIONAL_REQUIREMENTS || echo "Warning: optional packages not installed: $OPTIONAL_REQUIREMENTS"
 
 elif command -v python3 &> /dev/null; then
     echo "Using python3 venv + pip..."
@@ -73,6 +76,7 @@ elif command -v python3 &> /dev/null; then
     # Upgrade pip and install dependencies
     "$VENV_DIR/bin/pip" install --upgrade pip
     "$VENV_DIR/bin/pip" install $REQUIREMENTS
+    "$VENV_DIR/bin/pip" install $OPTIONAL_REQUIREMENTS || echo "Warning: optional packages not installed: $OPTIONAL_REQUIREMENTS"
 
 elif command -v python &> /dev/null; then
     echo "Using python venv + pip..."
@@ -85,6 +89,7 @@ elif command -v python &> /dev/null; then
     # Upgrade pip and install dependencies
     "$VENV_DIR/bin/pip" install --upgrade pip
     "$VENV_DIR/bin/pip" install $REQUIREMENTS
+    "$VENV_DIR/bin/pip" install $OPTIONAL_REQUIREMENTS || echo "Warning: optional packages not installed: $OPTIONAL_REQUIREMENTS"
 
 else
     echo "Error: No Python installation found."
@@ -95,7 +100,7 @@ fi
 # Verify installation
 echo ""
 echo "Verifying installation..."
-if "$VENV_DIR/bin/python" -c "import fitz, pdfplumber, weasyprint; print('All packages installed successfully')" 2>/dev/null; then
+if "$VENV_DIR/bin/python" -c "import fitz, weasyprint; print('All packages installed successfully')" 2>/dev/null; then
     echo ""
     echo "Environment setup complete!"
     echo "Virtual environment: $VENV_DIR"
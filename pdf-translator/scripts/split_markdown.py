@@ -2,16 +2,29 @@
 """Markdown Splitter - Splits large Markdown files into sections for translation."""
 
 import argparse
+import json
 import os
 import re
+from pathlib import Path
 from typing import List, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Runs of word characters; same count as \b\w+\b, without the boundary checks
+_WORD_RE = re.compile(r'\w+')
+_CJK_CHAR_RE = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af]')
+_HEADING_RE = re.compile(r'^(#{1,4})\s+.+$', re.MULTILINE)
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count (roughly 4 chars per token for English, 2 for CJK)."""
     # Simple estimation: count words and CJK characters
-    words = len(re.findall(r'\b\w+\b', text))
-    cjk_chars = len(re.findall(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af]', text))
+    words = len(_WORD_RE.findall(text))
+    cjk_chars = len(_CJK_CHAR_RE.findall(text))
     return words + cjk_chars
 
 
@@ -20,47 +33,68 @@ def find_split_points(content: str) -> List[int]:
     split_points = [0]
 
     # Find all heading positions
-    for match in re.finditer(r'^(#{1,4})\s+.+$', content, re.MULTILINE):
+    for match in _HEADING_RE.finditer(content):
         split_points.append(match.start())
 
     split_points.append(len(content))
     return sorted(set(split_points))
 
 
-def split_markdown(content: str, max_tokens: int = 6000) -> List[Tuple[str, int]]:
-    """Split markdown into chunks, respecting heading boundaries.
+def split_sections(content: str) -> List[Tuple[str, int]]:
+    """Split content at headings; returns list of (section, estimated_tokens).
 
-    Returns list of (chunk_content, estimated_tokens).
+    Sections start at a heading's '#' after a newline, so no word spans two
+    sections and the section estimates sum to estimate_tokens(content).
     """
     split_points = find_split_points(content)
-    chunks = []
-    current_chunk = ""
-    current_tokens = 0
-
+    sections = []
     for i in range(len(split_points) - 1):
         section = content[split_points[i]:split_points[i + 1]]
-        section_tokens = estimate_tokens(section)
+        sections.append((section, estimate_tokens(section)))
+    return sections
+
+
+def group_sections(sections: List[Tuple[str, int]], max_tokens: int = 6000) -> List[Tuple[str, int]]:
+    """Group consecutive (section, tokens) pairs into chunks of up to max_tokens.
+
+    Returns list of (chunk_content, estimated_tokens).
+    """
+    chunks = []
+    # Collect the current chunk's sections in a list and join once on flush,
+    # instead of growing a string with += per section
+    current_parts = []
+    current_tokens = 0
 
+    for section, section_tokens in sections:
         # If single section exceeds max, we need to include it anyway
-        if section_tokens > max_tokens and current_chunk:
-            chunks.append((current_chunk.strip(), current_tokens))
-            current_chunk = section
+        if section_tokens > max_tokens and current_parts:
+            chunks.append((''.join(current_parts).strip(), current_tokens))
+            current_parts = [section]
             current_tokens = section_tokens
-        elif current_tokens + section_tokens > max_tokens and current_chunk:
-            chunks.append((current_chunk.strip(), current_tokens))
-            current_chunk = section
+        elif current_tokens + section_tokens > max_tokens and current_parts:
+            chunks.append((''.join(current_parts).strip(), current_tokens))
+            current_parts = [section]
             current_tokens = section_tokens
         else:
-            current_chunk += section
+            current_parts.append(section)
             current_tokens += section_tokens
 
     # Add remaining
-    if current_chunk.strip():
-        chunks.append((current_chunk.strip(), current_tokens))
+    current_chunk = ''.join(current_parts).strip()
+    if current_chunk:
+        chunks.append((current_chunk, current_tokens))
 
     return chunks
 
 
+def split_markdown(content: str, max_tokens: int = 6000) -> List[Tuple[str, int]]:
+    """Split markdown into chunks, respecting heading boundaries.
+
+    Returns list of (chunk_content, estimated_tokens).
+    """
+    return group_sections(split_sections(content), max_tokens)
+
+
 def extract_frontmatter(content: str) -> Tuple[str, str]:
     """Separate frontmatter from content."""
     if content.startswith('---'):
@@ -84,8 +118,7 @@ def save_chunks(chunks: List[Tuple[str, int]], output_dir: str, frontmatter: str
         # Add section marker
         content = f"<!-- Section {i + 1} of {len(chunks)} -->\n\n{chunk}"
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Path(filepath).write_text(content, encoding='utf-8')
 
         paths.append(filepath)
         print(f"  {filename}: ~{tokens} tokens")
@@ -104,19 +137,20 @@ def main():
         print(f"Error: File not found: {args.input}")
         return 1
 
-    with open(args.input, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = Path(args.input).read_text(encoding='utf-8')
 
     frontmatter, body = extract_frontmatter(content)
 
-    total_tokens = estimate_tokens(body)
+    # One token-counting pass: the per-section estimates also give the total
+    sections = split_sections(body)
+    total_tokens = sum(tokens for _, tokens in sections)
     print(f"Total estimated tokens: {total_tokens}")
 
     if total_tokens <= args.max_tokens:
         print("Document fits in single section, no splitting needed")
         chunks = [(body, total_tokens)]
     else:
-        chunks = split_markdown(body, args.max_tokens)
+        chunks = group_sections(sections, args.max_tokens)
         print(f"Split into {len(chunks)} sections:")
 
     # Save
@@ -131,10 +165,13 @@ def main():
         "files": [os.path.basename(p) for p in paths]
     }
 
-    import json
     manifest_path = os.path.join(args.output_dir, "sections_manifest.json")
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
+    if orjson is not None:
+        with open(manifest_path, 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(manifest, indent=2))
 
     print(f"\nManifest saved: {manifest_path}")
     return 0